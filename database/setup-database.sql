@@ -63,6 +63,8 @@ INSERT INTO orders (user_id, product_id, quantity, total_price, status) VALUES
 DROP USER IF EXISTS 'appuser'@'localhost';
 CREATE USER 'appuser'@'localhost' IDENTIFIED BY '72Je!^NY06OPx$uW';
 GRANT ALL PRIVILEGES ON testdb.* TO 'appuser'@'localhost';
+-- Per-worker schemas used by the parallel sample test runner (it drops them at the end of each run)
+GRANT ALL ON `testdb\_w%`.* TO 'appuser'@'localhost';
 FLUSH PRIVILEGES;
 
 SELECT 'Database setup completed successfully!' AS status;
\ No newline at end of file
@@ -0,0 +1,689 @@
+# Copyright (c) 2026 dmj.one
+#
+# This software is part of the dmj.one initiative.
+# Created by Nikhil Bhardwaj.
+#
+# Licensed under the MIT License.
+#!/usr/bin/env python3
+"""
+Columnar Result Sets for MySQL Reads
+Decodes raw cursor rows straight into per-column typed arrays instead of
+building one dict per row.
+
+Column layouts:
+    int        -> array('q')
+    float      -> array('d')
+    decimal    -> array('q') of scaled integers (999.99 @ scale 2 -> 99999)
+    timestamp  -> array('q') of epoch seconds (server time zone, no conversion)
+    string     -> array('q') offsets + bytearray of UTF-8 data
+
+Integer and decimal values that do not fit in int64 (BIGINT UNSIGNED,
+DECIMAL(19+)) switch their column to a list of Python ints instead of failing.
+NULLs are tracked in a per-column bytearray mask; MySQL zero dates
+('0000-00-00') are stored as NULL, as cursor(dictionary=True) returns None.
+
+When NumPy is installed the arrays are exposed as zero-copy ndarrays and
+filters/aggregates are vectorized. Without NumPy the same API runs on
+C-level map/compress over the arrays: memory use is the same, but decoding
+and filter queries are slower than the plain dict path, so the fallback is
+worth using for memory only.
+
+Usage:
+    with conn.cursor(raw=True) as cursor:
+        cursor.execute("SELECT id, total_price, status FROM orders")
+        result = ColumnarResult.from_cursor(cursor)
+    shipped = result.filter(result.mask("status", "==", "shipped"))
+    print(shipped.sum("total_price"))
+"""
+
+import calendar
+import datetime
+import math
+import operator
+import sys
+from array import array
+from decimal import Decimal
+from itertools import accumulate, chain, compress, islice, repeat
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+try:
+    from mysql.connector import FieldFlag, FieldType
+except ImportError:  # Only needed by ColumnarResult.from_cursor
+    FieldFlag = FieldType = None
+
+
+OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+}
+
+
+# ==============================================================================
+# RAW VALUE DECODERS
+# ==============================================================================
+
+def _days_from_civil(year: int, month: int, day: int) -> int:
+    """Days since 1970-01-01 for a proleptic Gregorian date (no datetime objects)."""
+    year -= month <= 2
+    era = (year if year >= 0 else year - 399) // 400
+    yoe = year - era * 400
+    doy = (153 * (month + (-3 if month > 2 else 9)) + 2) // 5 + day - 1
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+    return era * 146097 + doe - 719468
+
+
+def parse_timestamp(raw: Union[bytes, str]) -> int:
+    """Convert 'YYYY-MM-DD[ HH:MM:SS[.ffffff]]' (bytes or str) to epoch seconds.
+
+    Raises ValueError for dates datetime would reject, including MySQL zero
+    dates such as '0000-00-00'.
+    """
+    year, month, day = int(raw[0:4]), int(raw[5:7]), int(raw[8:10])
+    if not (year >= 1 and 1 <= month <= 12 and 1 <= day <= calendar.monthrange(year, month)[1]):
+        raise ValueError(f"Invalid date {raw!r}")
+    days = _days_from_civil(year, month, day)
+    seconds = 0
+    if len(raw) >= 19:
+        seconds = int(raw[11:13]) * 3600 + int(raw[14:16]) * 60 + int(raw[17:19])
+    return days * 86400 + seconds
+
+
+def parse_decimal(raw: bytes, scale: int) -> int:
+    """Convert b'-123.45' to a scaled integer at the given scale."""
+    whole, _, frac = bytes(raw).partition(b'.')
+    if len(frac) > scale:
+        raise ValueError(f"Decimal {raw!r} has more than {scale} fractional digits")
+    negative = whole.startswith(b'-')
+    value = abs(int(whole or b'0')) * 10 ** scale + int((frac or b'0').ljust(scale, b'0') or b'0')
+    return -value if negative else value
+
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+_SECOND = datetime.timedelta(seconds=1)
+_MIN_TIMESTAMP = (datetime.datetime(1, 1, 1) - _EPOCH) // _SECOND
+
+
+def _decimal_scale(raw: bytes) -> int:
+    _, _, frac = bytes(raw).partition(b'.')
+    return len(frac)
+
+
+# ==============================================================================
+# COLUMNS
+# ==============================================================================
+
+class Column:
+    """A single typed column backed by an array and an optional NULL mask."""
+
+    kind = 'int'
+    typecode = 'q'
+    null_fill = b'0'  # decoded in place of NULL; the mask hides it
+
+    def __init__(self, name: str, wide: bool = False):
+        self.name = name
+        self.values: Union[array, List[int]] = [] if wide else array(self.typecode)
+        self.nulls: Optional[bytearray] = None
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @property
+    def wide(self) -> bool:
+        """True once values are held as Python ints because one overflowed int64."""
+        return isinstance(self.values, list)
+
+    @property
+    def _vectorized(self) -> bool:
+        return np is not None and not self.wide
+
+    def _dtype(self):
+        return np.int64 if self.typecode == 'q' else np.float64
+
+    def append_raw(self, raw: Optional[bytes]):
+        value = 0 if raw is None else self.decode(raw)
+        self._extend_nulls((raw,))
+        self._store((value,))
+
+    def extend_raw(self, raws: Sequence[Optional[bytes]]):
+        """Append one column's values from a batch of rows (see ColumnarResult.from_rows).
+
+        Values are decoded before anything is appended, so a batch that fails
+        to decode leaves the column unchanged.
+        """
+        decoded = self.decode_many(self._fill_nulls(raws))
+        if not (np is not None and isinstance(decoded, np.ndarray)):
+            decoded = list(decoded)
+        self._extend_nulls(raws)
+        self._store(decoded)
+
+    def _fill_nulls(self, raws: Sequence[Optional[bytes]]) -> Sequence[bytes]:
+        if None in raws:
+            return [self.null_fill if r is None else r for r in raws]
+        return raws
+
+    def _extend_nulls(self, raws: Sequence[Optional[bytes]]):
+        if None in raws:
+            if self.nulls is None:
+                self.nulls = bytearray(len(self))
+            self.nulls += bytes(r is None for r in raws)
+        elif self.nulls is not None:
+            self.nulls += bytes(len(raws))
+
+    def _store(self, decoded):
+        """Append decoded values, switching to a list of ints if one overflows the array."""
+        if np is not None and isinstance(decoded, np.ndarray):
+            if not self.wide:
+                self.values.frombytes(decoded.astype(self._dtype()).tobytes())
+                return
+            decoded = decoded.tolist()
+        if not self.wide:
+            start = len(self.values)
+            try:
+                self.values.extend(decoded)
+                return
+            except OverflowError:
+                del self.values[start:]
+                self.values = self.values.tolist()
+        self.values.extend(decoded)
+
+    def decode(self, raw: bytes) -> Any:
+        return int(raw)
+
+    def decode_many(self, raws: Sequence[bytes]) -> Iterable[Any]:
+        return map(int, raws)
+
+    def encode(self, value: Any) -> Any:
+        """Convert a Python value into the column's stored representation."""
+        return int(value)
+
+    def to_python(self, stored: Any) -> Any:
+        return stored
+
+    def is_null(self, index: int) -> bool:
+        return self.nulls is not None and self.nulls[index] == 1
+
+    def __getitem__(self, index: int) -> Any:
+        if self.is_null(index):
+            return None
+        return self.to_python(self.values[index])
+
+    @property
+    def nbytes(self) -> int:
+        nulls = len(self.nulls) if self.nulls is not None else 0
+        if self.wide:
+            return sys.getsizeof(self.values) + sum(map(sys.getsizeof, self.values)) + nulls
+        return self.values.itemsize * len(self.values) + nulls
+
+    def to_numpy(self):
+        """Zero-copy ndarray view of the stored values (requires NumPy).
+
+        Wide columns return an object-dtype copy instead.
+        """
+        if np is None:
+            raise RuntimeError("NumPy is not installed")
+        if self.wide:
+            return np.array(self.values, dtype=object)
+        return np.frombuffer(self.values, dtype=self._dtype())
+
+    def _valid(self) -> Iterator[Any]:
+        if self.nulls is None:
+            return iter(self.values)
+        return compress(self.values, map(operator.not_, self.nulls))
+
+    def _not_null_mask(self) -> Sequence[bool]:
+        if self._vectorized:
+            if self.nulls is None:
+                return np.ones(len(self), dtype=bool)
+            return np.frombuffer(self.nulls, dtype=np.uint8) == 0
+        if self.nulls is None:
+            return bytearray(b'\x01') * len(self)
+        return bytearray(map(operator.not_, self.nulls))
+
+    def mask(self, op: str, value: Any) -> Sequence[bool]:
+        """Boolean mask of rows where `column <op> value`; NULLs never match."""
+        return self._mask(op, self.encode(value))
+
+    def _mask(self, op: str, target: Any) -> Sequence[bool]:
+        compare = OPERATORS[op]
+        if self._vectorized:
+            result = compare(self.to_numpy(), target)
+            if self.nulls is not None:
+                result &= np.frombuffer(self.nulls, dtype=np.uint8) == 0
+            return result
+        result = bytearray(map(compare, self.values, repeat(target, len(self.values))))
+        if self.nulls is not None:
+            result = bytearray(map(operator.gt, result, self.nulls))  # 1 only where matched and not NULL
+        return result
+
+    def take(self, indices: Sequence[int]) -> 'Column':
+        """New column holding the rows at `indices` (an ndarray when NumPy is used)."""
+        column = self.__class__.__new__(self.__class__)
+        column.__dict__.update(self.__dict__)
+        if self._vectorized and isinstance(indices, np.ndarray):
+            column.values = array(self.typecode, self.to_numpy()[indices].tobytes())
+            if self.nulls is not None:
+                column.nulls = bytearray(np.frombuffer(self.nulls, dtype=np.uint8)[indices].tobytes())
+            return column
+        picked = map(self.values.__getitem__, indices)
+        column.values = list(picked) if self.wide else array(self.typecode, picked)
+        column.nulls = bytearray(map(self.nulls.__getitem__, indices)) if self.nulls is not None else None
+        return column
+
+    def _valid_numpy(self):
+        values = self.to_numpy()
+        if self.nulls is None:
+            return values
+        return values[np.frombuffer(self.nulls, dtype=np.uint8) == 0]
+
+    def sum(self) -> Any:
+        if self._vectorized:
+            return self.to_python(self._valid_numpy().sum().item())
+        return self.to_python(sum(self._valid()))
+
+    def min(self) -> Any:
+        if self._vectorized:
+            values = self._valid_numpy()
+            return self.to_python(values.min().item()) if len(values) else None
+        values = list(self._valid())
+        return self.to_python(min(values)) if values else None
+
+    def max(self) -> Any:
+        if self._vectorized:
+            values = self._valid_numpy()
+            return self.to_python(values.max().item()) if len(values) else None
+        values = list(self._valid())
+        return self.to_python(max(values)) if values else None
+
+    def count(self) -> int:
+        return len(self) - (sum(self.nulls) if self.nulls is not None else 0)
+
+
+class FloatColumn(Column):
+    kind = 'float'
+    typecode = 'd'
+
+    def decode(self, raw: bytes) -> float:
+        return float(raw)
+
+    def decode_many(self, raws: Sequence[bytes]) -> Iterable[float]:
+        return map(float, raws)
+
+    def encode(self, value: Any) -> float:
+        return float(value)
+
+
+class DecimalColumn(Column):
+    """Fixed-point column stored as integers scaled by 10 ** scale."""
+
+    kind = 'decimal'
+
+    def __init__(self, name: str, scale: Optional[int] = None, wide: bool = False):
+        super().__init__(name, wide)
+        self.scale = scale
+
+    def decode(self, raw: bytes) -> int:
+        if self.scale is None:
+            self.scale = _decimal_scale(raw)
+        return parse_decimal(raw, self.scale)
+
+    def extend_raw(self, raws: Sequence[Optional[bytes]]):
+        if self.scale is None:
+            first = next((r for r in raws if r is not None), None)
+            if first is not None:
+                self.scale = _decimal_scale(first)
+        super().extend_raw(raws)
+
+    def decode_many(self, raws: Sequence[bytes]) -> Iterable[int]:
+        # Values already at the column scale just lose their '.'; anything else is parsed.
+        scale = self.scale or 0
+        if np is not None:
+            # Via float64 is exact while |scaled value| < 2**50; MySQL always sends
+            # exactly `scale` fractional digits for a DECIMAL column.
+            try:
+                scaled = np.rint(np.array(raws, dtype=bytes).astype(np.float64) * 10 ** scale)
+            except (ValueError, TypeError):
+                scaled = None  # bytearray values (pure-Python connector)
+            if scaled is not None and (not len(scaled) or np.abs(scaled).max() < 2 ** 50):
+                return scaled.astype(np.int64)
+        if not scale:
+            return [parse_decimal(r, 0) for r in raws]
+        dot = -scale - 1
+        return [int(r.replace(b'.', b'')) if len(r) > scale and r[dot] == 46 else parse_decimal(r, scale)
+                for r in raws]
+
+    def _scaled(self, value: Any) -> Decimal:
+        return Decimal(str(value)).scaleb(self.scale or 0)
+
+    def encode(self, value: Any) -> int:
+        scaled = self._scaled(value)
+        if scaled != scaled.to_integral_value():
+            raise ValueError(f"{value!r} has more than {self.scale or 0} fractional digits")
+        return int(scaled)
+
+    def mask(self, op: str, value: Any) -> Sequence[bool]:
+        """Like Column.mask, but exact for values with more digits than the scale.
+
+        At scale 2, `< 0.005` must keep 0.00 and `== 0.004` must match nothing,
+        so the bound is rounded in the direction the operator needs.
+        """
+        scaled = self._scaled(value)
+        if scaled == scaled.to_integral_value():
+            return self._mask(op, int(scaled))
+        if op in ('<', '<='):
+            return self._mask('<=', math.floor(scaled))
+        if op in ('>', '>='):
+            return self._mask('>=', math.ceil(scaled))
+        OPERATORS[op]  # unknown operators raise KeyError like Column.mask
+        matches = self._not_null_mask()
+        if op == '!=':
+            return matches
+        return np.zeros(len(self), dtype=bool) if self._vectorized else bytearray(len(self))
+
+    def to_python(self, stored: Any) -> Decimal:
+        return Decimal(stored).scaleb(-(self.scale or 0))
+
+
+def _valid_timestamp(raw: Optional[bytes]) -> Optional[bytes]:
+    """raw if it parses as a date, else None (zero dates and other invalid dates)."""
+    if raw is None:
+        return None
+    try:
+        parse_timestamp(raw)
+    except ValueError:
+        return None
+    return raw
+
+
+class TimestampColumn(Column):
+    """DATE/DATETIME/TIMESTAMP column stored as epoch seconds.
+
+    Values come back as datetime (or date, for `date_only` columns) like the
+    dict cursor returns; fractional seconds are truncated.
+    """
+
+    kind = 'timestamp'
+    null_fill = b'1970-01-01'
+
+    def __init__(self, name: str, date_only: bool = False):
+        super().__init__(name)
+        self.date_only = date_only
+
+    def append_raw(self, raw: Optional[bytes]):
+        super().append_raw(_valid_timestamp(raw))
+
+    def extend_raw(self, raws: Sequence[Optional[bytes]]):
+        try:
+            super().extend_raw(raws)
+        except ValueError:
+            # Only batches holding a zero date or other invalid date are rescanned.
+            super().extend_raw([_valid_timestamp(r) for r in raws])
+
+    def decode(self, raw: bytes) -> int:
+        return parse_timestamp(raw)
+
+    def decode_many(self, raws: Sequence[bytes]) -> Iterable[int]:
+        # Fractional seconds are truncated on both paths ('S19' cuts them off).
+        if np is not None:
+            try:
+                stamps = np.array(raws, dtype='S19').astype('datetime64[s]').astype(np.int64)
+            except ValueError:
+                pass  # bytearray values (pure-Python connector) or unparseable text
+            else:
+                # NumPy accepts year 0, which datetime (and the dict cursor) reject.
+                if not len(stamps) or stamps.min() >= _MIN_TIMESTAMP:
+                    return stamps
+        fromisoformat = datetime.datetime.fromisoformat
+        return [(fromisoformat(r[:19].decode()) - _EPOCH) // _SECOND for r in raws]
+
+    def encode(self, value: Any) -> int:
+        """Epoch seconds from an int, a date/datetime, or an ISO string or bytes."""
+        if isinstance(value, (int, float)):
+            return int(value)
+        if isinstance(value, (str, bytes, bytearray)):
+            return parse_timestamp(value)
+        return parse_timestamp(value.isoformat())
+
+    def to_python(self, stored: int) -> Union[datetime.datetime, datetime.date]:
+        value = _EPOCH + datetime.timedelta(seconds=stored)
+        return value.date() if self.date_only else value
+
+    def sum(self) -> Any:
+        raise TypeError(f"Cannot sum timestamp column '{self.name}'")
+
+
+class StringColumn(Column):
+    """Variable-length column stored as an offsets array plus one bytes buffer."""
+
+    kind = 'string'
+    null_fill = b''
+
+    def __init__(self, name: str, encoding: str = 'utf-8'):
+        super().__init__(name)
+        self.encoding = encoding
+        self.values = array('q', [0])  # offsets, len(rows) + 1
+        self.data = bytearray()
+
+    def __len__(self) -> int:
+        return len(self.values) - 1
+
+    def append_raw(self, raw: Optional[bytes]):
+        self._extend_nulls((raw,))
+        if raw is not None:
+            self.data += raw
+        self.values.append(len(self.data))
+
+    def extend_raw(self, raws: Sequence[Optional[bytes]]):
+        self._extend_nulls(raws)
+        raws = self._fill_nulls(raws)
+        start = len(self.data)
+        self.data += b''.join(raws)
+        self.values.extend(islice(accumulate(chain((start,), map(len, raws))), 1, None))
+
+    def raw(self, index: int) -> bytes:
+        return bytes(self.data[self.values[index]:self.values[index + 1]])
+
+    def __getitem__(self, index: int) -> Optional[str]:
+        if self.is_null(index):
+            return None
+        return self.raw(index).decode(self.encoding)
+
+    @property
+    def nbytes(self) -> int:
+        return super().nbytes + len(self.data)
+
+    def to_numpy(self):
+        raise TypeError(f"String column '{self.name}' has no numeric ndarray view")
+
+    def _valid(self) -> Iterator[str]:
+        return (self[i] for i in range(len(self)) if not self.is_null(i))
+
+    def mask(self, op: str, value: Any) -> Sequence[bool]:
+        compare = OPERATORS[op]
+        target = value.encode(self.encoding) if isinstance(value, str) else bytes(value)
+        if np is not None and op in ('==', '!='):
+            return self._equals_numpy(target) if op == '==' else self._not_null_mask() & ~self._equals_numpy(target)
+        data = bytes(self.data)
+        offsets = self.values
+        result = bytearray(map(compare, map(data.__getitem__, map(slice, offsets, islice(offsets, 1, None))),
+                               repeat(target, len(self))))
+        if self.nulls is not None:
+            result = bytearray(map(operator.gt, result, self.nulls))
+        if np is not None:
+            return np.frombuffer(result, dtype=np.uint8).astype(bool)
+        return result
+
+    def _equals_numpy(self, target: bytes):
+        """Equality against the offsets/data buffers without decoding any row."""
+        offsets = np.frombuffer(self.values, dtype=np.int64)
+        result = (offsets[1:] - offsets[:-1] == len(target)) & self._not_null_mask()
+        candidates = np.flatnonzero(result)
+        if len(target) and len(candidates):
+            data = np.frombuffer(self.data, dtype=np.uint8)
+            window = offsets[candidates][:, None] + np.arange(len(target))
+            needle = np.frombuffer(target, dtype=np.uint8)
+            result[candidates] = (data[window] == needle).all(axis=1)
+        return result
+
+    def take(self, indices: Sequence[int]) -> 'StringColumn':
+        """New column holding the rows at `indices` (an ndarray when NumPy is used)."""
+        if np is not None and isinstance(indices, np.ndarray):
+            return self._take_numpy(indices)
+        column = StringColumn(self.name, self.encoding)
+        column.extend_raw([None if self.is_null(i) else self.raw(i) for i in indices])
+        return column
+
+    def _take_numpy(self, indices) -> 'StringColumn':
+        """Gather rows by offsets: one fancy-index over the data buffer."""
+        offsets = np.frombuffer(self.values, dtype=np.int64)
+        starts = offsets[:-1][indices]
+        lengths = offsets[1:][indices] - starts
+        new_offsets = np.zeros(len(indices) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=new_offsets[1:])
+        column = StringColumn(self.name, self.encoding)
+        column.values = array('q', new_offsets.tobytes())
+        total = int(new_offsets[-1])
+        if total:
+            gather = np.repeat(starts - new_offsets[:-1], lengths) + np.arange(total)
+            column.data = bytearray(np.frombuffer(self.data, dtype=np.uint8)[gather].tobytes())
+        if self.nulls is not None:
+            column.nulls = bytearray(np.frombuffer(self.nulls, dtype=np.uint8)[indices].tobytes())
+        return column
+
+    def sum(self) -> Any:
+        raise TypeError(f"Cannot sum string column '{self.name}'")
+
+    def min(self) -> Optional[str]:
+        return min(self._valid(), default=None)
+
+    def max(self) -> Optional[str]:
+        return max(self._valid(), default=None)
+
+
+# ==============================================================================
+# RESULT SET
+# ==============================================================================
+
+def column_for_field_type(name: str, type_code: int, flags: int = 0, precision: Optional[int] = None) -> Column:
+    """Pick the column layout for a mysql.connector FieldType code.
+
+    BIGINT UNSIGNED and DECIMAL with more than 18 digits can exceed int64, so
+    they start out wide (Python ints). mysql.connector leaves `precision` as
+    None in cursor.description; such DECIMAL columns widen on the first value
+    that overflows instead.
+    """
+    if FieldType is None:
+        raise RuntimeError("mysql-connector-python is required to map field types")
+    if type_code in (FieldType.DECIMAL, FieldType.NEWDECIMAL):
+        return DecimalColumn(name, wide=precision is not None and precision > 18)
+    if type_code in (FieldType.FLOAT, FieldType.DOUBLE):
+        return FloatColumn(name)
+    if type_code in FieldType.get_number_types():
+        return Column(name, wide=type_code == FieldType.LONGLONG and bool(flags & FieldFlag.UNSIGNED))
+    if type_code in (FieldType.DATE, FieldType.NEWDATE):
+        return TimestampColumn(name, date_only=True)
+    if type_code in (FieldType.DATETIME, FieldType.TIMESTAMP):
+        return TimestampColumn(name)
+    return StringColumn(name)
+
+
+def _fetch_batches(cursor, batch_size: int) -> Iterator[Sequence[Sequence[Optional[bytes]]]]:
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            return
+        yield rows
+
+
+class ColumnarResult:
+    """A result set held as named columns rather than a list of row dicts."""
+
+    def __init__(self, columns: List[Column]):
+        self.columns: Dict[str, Column] = {c.name: c for c in columns}
+
+    @classmethod
+    def from_cursor(cls, cursor, batch_size: int = 10000) -> 'ColumnarResult':
+        """Drain an executed `raw=True` cursor into typed columns."""
+        # description: (name, type_code, display_size, internal_size, precision, scale, null_ok, flags, ...)
+        columns = [column_for_field_type(d[0], d[1], d[7] if len(d) > 7 else 0, d[4]) for d in cursor.description]
+        return cls.from_rows(columns, _fetch_batches(cursor, batch_size))
+
+    @classmethod
+    def from_rows(cls, columns: List[Column], batches: Iterable[Sequence[Sequence[Optional[bytes]]]]) -> 'ColumnarResult':
+        """Append batches of raw (bytes or None) rows to empty columns.
+
+        Each batch is transposed and decoded a column at a time, so the
+        per-value work is a C-level map/join rather than a Python call.
+        """
+        getters = [operator.itemgetter(i) for i in range(len(columns))]
+        for rows in batches:
+            if not rows:
+                continue
+            for column, getter in zip(columns, getters):
+                column.extend_raw(list(map(getter, rows)))
+        return cls(columns)
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def __getitem__(self, name: str) -> Column:
+        return self.columns[name]
+
+    @property
+    def nbytes(self) -> int:
+        return sum(c.nbytes for c in self.columns.values())
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        """Yield rows as dicts, for callers that still expect the dict format.
+
+        Values match cursor(dictionary=True) except that fractional seconds
+        are truncated and zero dates are None (the connector also gives None).
+        """
+        for i in range(len(self)):
+            yield {name: column[i] for name, column in self.columns.items()}
+
+    def mask(self, name: str, op: str, value: Any) -> Sequence[bool]:
+        return self.columns[name].mask(op, value)
+
+    @staticmethod
+    def _indices(mask: Sequence[bool]) -> Sequence[int]:
+        if np is not None:
+            if isinstance(mask, (bytes, bytearray)):
+                mask = np.frombuffer(mask, dtype=np.uint8)
+            return np.flatnonzero(np.asarray(mask, dtype=bool))
+        return list(compress(range(len(mask)), mask))
+
+    def filter(self, mask: Sequence[bool]) -> 'ColumnarResult':
+        """Keep only the rows where mask is truthy."""
+        indices = self._indices(mask)
+        return ColumnarResult([c.take(indices) for c in self.columns.values()])
+
+    def _select(self, name: str, where: Optional[Sequence[bool]]) -> Column:
+        """The named column, restricted to the `where` mask without copying other columns."""
+        column = self.columns[name]
+        return column if where is None else column.take(self._indices(where))
+
+    def sum(self, name: str, where: Optional[Sequence[bool]] = None) -> Any:
+        return self._select(name, where).sum()
+
+    def min(self, name: str, where: Optional[Sequence[bool]] = None) -> Any:
+        return self._select(name, where).min()
+
+    def max(self, name: str, where: Optional[Sequence[bool]] = None) -> Any:
+        return self._select(name, where).max()
+
+    def count(self, name: str, where: Optional[Sequence[bool]] = None) -> int:
+        return self._select(name, where).count()
+
+    def mean(self, name: str, where: Optional[Sequence[bool]] = None) -> Optional[float]:
+        column = self._select(name, where)
+        count = column.count()
+        return float(column.sum()) / count if count else None
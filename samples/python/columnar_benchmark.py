@@ -0,0 +1,146 @@
+# Copyright (c) 2026 dmj.one
+#
+# This software is part of the dmj.one initiative.
+# Created by Nikhil Bhardwaj.
+#
+# Licensed under the MIT License.
+#!/usr/bin/env python3
+"""
+Columnar vs Dictionary Result Set Benchmark
+Decodes synthetic `orders` rows (as a raw=True cursor returns them) two ways:
+
+    dict      one dict per row with int/Decimal/datetime/str values, the shape
+              cursor(dictionary=True).fetchall() hands back
+    columnar  ColumnarResult typed arrays
+
+and reports decode time, retained memory (tracemalloc) and a filter + sum
+query on each. No MySQL server is needed. Without NumPy, expect the memory
+saving only: columnar decoding and the query are both slower than dicts.
+
+Run: python samples/python/columnar_benchmark.py [--rows 1000000] [--json]
+"""
+
+import argparse
+import datetime
+import gc
+import json
+import time
+import tracemalloc
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Tuple
+
+import columnar
+from columnar import Column, ColumnarResult, DecimalColumn, StringColumn, TimestampColumn
+
+STATUSES = [b"pending", b"processing", b"shipped", b"delivered"]
+
+
+def synthetic_rows(count: int) -> List[Tuple[bytes, ...]]:
+    """Raw orders rows: id, user_id, quantity, total_price, status, order_date."""
+    base = datetime.datetime(2026, 1, 1)
+    rows = []
+    for i in range(count):
+        stamp = base + datetime.timedelta(seconds=i * 37)
+        rows.append((
+            str(i + 1).encode(),
+            str(i % 5000 + 1).encode(),
+            str(i % 9 + 1).encode(),
+            f"{(i * 7919) % 100000 / 100:.2f}".encode(),
+            STATUSES[i % len(STATUSES)],
+            stamp.strftime("%Y-%m-%d %H:%M:%S").encode(),
+        ))
+    return rows
+
+
+def decode_dicts(rows: List[Tuple[bytes, ...]]) -> List[Dict[str, Any]]:
+    """What the connector does for dictionary=True: convert each value, build a dict."""
+    fromisoformat = datetime.datetime.fromisoformat
+    return [
+        {
+            "id": int(r[0]),
+            "user_id": int(r[1]),
+            "quantity": int(r[2]),
+            "total_price": Decimal(r[3].decode()),
+            "status": r[4].decode(),
+            "order_date": fromisoformat(r[5].decode()),
+        }
+        for r in rows
+    ]
+
+
+def decode_columnar(rows: List[Tuple[bytes, ...]]) -> ColumnarResult:
+    columns = [Column("id"), Column("user_id"), Column("quantity"), DecimalColumn("total_price"),
+               StringColumn("status"), TimestampColumn("order_date")]
+    # Same 10,000-row batches ColumnarResult.from_cursor pulls with fetchmany().
+    return ColumnarResult.from_rows(columns, (rows[i:i + 10000] for i in range(0, len(rows), 10000)))
+
+
+def query_dicts(rows: List[Dict[str, Any]]) -> Decimal:
+    return sum((r["total_price"] for r in rows if r["status"] == "shipped"), Decimal(0))
+
+
+def query_columnar(result: ColumnarResult) -> Decimal:
+    return result.sum("total_price", where=result.mask("status", "==", "shipped"))
+
+
+def measure(decode: Callable[[Any], Any], rows) -> Tuple[Any, float, int]:
+    """Decode time (s) and bytes still allocated by the decoded result.
+
+    Timing and memory come from separate runs; tracemalloc slows allocation
+    enough to distort the timing.
+    """
+    gc.collect()
+    start = time.perf_counter()
+    decode(rows)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    tracemalloc.start()
+    result = decode(rows)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, retained
+
+
+def timed(fn: Callable[[], Any]) -> Tuple[Any, float]:
+    start = time.perf_counter()
+    value = fn()
+    return value, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare columnar and dict result sets on synthetic rows.")
+    parser.add_argument("--rows", type=int, default=1000000, help="number of synthetic rows")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    rows = synthetic_rows(args.rows)
+    dicts, dict_time, dict_bytes = measure(decode_dicts, rows)
+    result, col_time, col_bytes = measure(decode_columnar, rows)
+    dict_total, dict_query = timed(lambda: query_dicts(dicts))
+    col_total, col_query = timed(lambda: query_columnar(result))
+    assert dict_total == col_total, (dict_total, col_total)
+
+    report = {
+        "rows": args.rows,
+        "numpy": columnar.np is not None,
+        "dict": {"decode_s": dict_time, "retained_bytes": dict_bytes, "query_s": dict_query},
+        "columnar": {"decode_s": col_time, "retained_bytes": col_bytes, "nbytes": result.nbytes,
+                     "query_s": col_query},
+        "memory_ratio": dict_bytes / col_bytes,
+        "decode_speedup": dict_time / col_time,
+        "query_speedup": dict_query / col_query,
+    }
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"Rows: {args.rows:,}  (NumPy {'enabled' if report['numpy'] else 'not installed'})")
+    print(f"{'':<10} {'decode s':>10} {'memory MB':>10} {'query s':>10}")
+    print(f"{'dict':<10} {dict_time:>10.3f} {dict_bytes / 1e6:>10.1f} {dict_query:>10.4f}")
+    print(f"{'columnar':<10} {col_time:>10.3f} {col_bytes / 1e6:>10.1f} {col_query:>10.4f}")
+    print(f"Memory: {report['memory_ratio']:.1f}x smaller  Decode: {report['decode_speedup']:.1f}x  "
+          f"Query: {report['query_speedup']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -16,12 +16,15 @@ Run: python samples/python/mysql_test.py
 import mysql.connector
 from mysql.connector import Error
 from mysql.connector.cursor import MySQLCursor
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, Union
+from decimal import Decimal
 import logging
 import sys
 import os
 from contextlib import contextmanager
 
+from columnar import ColumnarResult
+
 # ==============================================================================
 # CONFIGURATION & LOGGING
 # ==============================================================================
@@ -75,14 +78,20 @@ class UsersDAO:
     def __init__(self, connection):
         self.connection = connection
 
-    def get_all(self) -> List[Dict[str, Any]]:
+    def get_all(self, columnar: bool = False) -> Union[List[Dict[str, Any]], ColumnarResult]:
+        """Fetch all users as row dicts, or as a ColumnarResult when columnar=True."""
+        query = "SELECT id, name, email, age FROM users"
         try:
+            if columnar:
+                with self.connection.cursor(raw=True) as cursor:
+                    cursor.execute(query)
+                    return ColumnarResult.from_cursor(cursor)
             with self.connection.cursor(dictionary=True) as cursor:
-                cursor.execute("SELECT id, name, email, age FROM users")
+                cursor.execute(query)
                 return cursor.fetchall()
         except Error as e:
             logger.error(f"Failed to fetch users: {e}")
-            return []
+            return ColumnarResult([]) if columnar else []
 
     def create(self, name: str, email: str, age: int) -> Optional[int]:
         try:
@@ -110,47 +119,160 @@ class UsersDAO:
             logger.error(f"Failed to update user: {e}")
             return False
 
+class OrdersDAO:
+    """Data Access Object for Orders operations."""
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def get_all(self, columnar: bool = False) -> Union[List[Dict[str, Any]], ColumnarResult]:
+        """Fetch all orders as row dicts, or as a ColumnarResult when columnar=True."""
+        query = ("SELECT id, user_id, product_id, quantity, total_price, status, order_date "
+                 "FROM orders")
+        try:
+            if columnar:
+                with self.connection.cursor(raw=True) as cursor:
+                    cursor.execute(query)
+                    return ColumnarResult.from_cursor(cursor)
+            with self.connection.cursor(dictionary=True) as cursor:
+                cursor.execute(query)
+                return cursor.fetchall()
+        except Error as e:
+            logger.error(f"Failed to fetch orders: {e}")
+            return ColumnarResult([]) if columnar else []
+
 def print_separator(title: str):
     print(f"\n{'='*20} {title} {'='*20}")
 
-def run_tests():
-    logger.info("Starting Enterprise MySQL Test Suite...")
-    
-    db_manager = DatabaseManager(DB_CONFIG)
-    
+# ==============================================================================
+# TEST ISOLATION
+# ==============================================================================
+
+TEST_EMAIL = "python.ent.test@example.com"
+ISOLATION_TABLES = ("users", "products", "orders")  # parents before children
+
+# Seed data from database/setup-database.sql
+SEED_USER_EMAILS = {"john@example.com", "jane@example.com", "bob@example.com"}
+SEED_ORDER_COUNT = 3
+SEED_ORDER_TOTAL = Decimal("1089.96")
+SEED_DELIVERED_TOTAL = Decimal("999.99")
+
+def _worker_schema(worker_id: int) -> str:
+    return f"{DB_CONFIG['database']}_w{worker_id}"
+
+def setup_isolation(worker_id: int):
+    """Point DB_CONFIG at a private copy of the schema for a parallel test worker.
+
+    Called by scripts/run_sample_tests.py in every test process, so the
+    worker's schema is dropped and rebuilt from the base schema before each
+    test (a few statements per table on the seed data) and every test starts
+    from the same state. Tables are recreated from SHOW CREATE TABLE, which,
+    unlike CREATE TABLE ... LIKE, keeps the FOREIGN KEY constraints.
+    """
+    base = DB_CONFIG['database']
+    schema = _worker_schema(worker_id)
+    conn = mysql.connector.connect(**DB_CONFIG)
     try:
-        with db_manager.connect() as conn:
-            user_dao = UsersDAO(conn)
-
-            # --- Test 1: READ ---
-            print_separator("Test 1: Read Users")
-            users = user_dao.get_all()
-            print(f"{'ID':<5} {'Name':<20} {'Email':<30} {'Age':<5}")
-            print("-" * 65)
-            for user in users:
-                print(f"{user['id']:<5} {user['name']:<20} {user['email']:<30} {user['age'] or 'N/A':<5}")
-            logger.info(f"Retrieved {len(users)} users.")
-
-            # --- Test 2: CREATE ---
-            print_separator("Test 2: Create User")
-            new_id = user_dao.create("Test User (Python)", "python.ent.test@example.com", 29)
-            if new_id:
-                logger.info("Create operation validated.")
-
-            # --- Test 3: UPDATE ---
-            print_separator("Test 3: Update User")
-            if user_dao.increment_age("python.ent.test@example.com"):
-                logger.info("Update operation validated.")
-            else:
-                logger.warning("Update operation affected 0 rows (user might not exist).")
+        with conn.cursor() as cursor:
+            ddl = {}
+            for table in ISOLATION_TABLES:
+                cursor.execute(f"SHOW CREATE TABLE `{base}`.`{table}`")
+                ddl[table] = cursor.fetchone()[1]
+            cursor.execute(f"DROP DATABASE IF EXISTS `{schema}`")
+            cursor.execute(f"CREATE DATABASE `{schema}`")
+            # Unqualified REFERENCES in the DDL resolve against the new schema.
+            cursor.execute(f"USE `{schema}`")
+            for table in ISOLATION_TABLES:
+                cursor.execute(ddl[table])
+                cursor.execute(f"INSERT INTO `{table}` SELECT * FROM `{base}`.`{table}`")
+        conn.commit()
+    finally:
+        conn.close()
+    DB_CONFIG['database'] = schema
+    logger.info(f"Using isolated schema {schema}")
+
+def teardown_isolation(worker_id: int):
+    """Drop the worker's schema; the runner calls this once per worker slot after the run."""
+    schema = _worker_schema(worker_id)
+    conn = mysql.connector.connect(**DB_CONFIG)
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute(f"DROP DATABASE IF EXISTS `{schema}`")
+    finally:
+        conn.close()
+    logger.info(f"Dropped isolated schema {schema}")
+
+def _delete_test_user(conn):
+    with conn.cursor() as cursor:
+        cursor.execute("DELETE FROM users WHERE email = %s", (TEST_EMAIL,))
+        conn.commit()
+        return cursor.rowcount
 
-            # --- CLEANUP ---
-            print_separator("Cleanup")
-            with conn.cursor() as cursor:
-                cursor.execute("DELETE FROM users WHERE email = %s", ("python.ent.test@example.com",))
-                conn.commit()
-                logger.info(f"Cleaned up {cursor.rowcount} test records.")
+# ==============================================================================
+# TESTS
+# ==============================================================================
+
+def test_read_users():
+    """Test 1: Read Users"""
+    print_separator("Test 1: Read Users")
+    with DatabaseManager(DB_CONFIG).connect() as conn:
+        users = UsersDAO(conn).get_all()
+        print(f"{'ID':<5} {'Name':<20} {'Email':<30} {'Age':<5}")
+        print("-" * 65)
+        for user in users:
+            print(f"{user['id']:<5} {user['name']:<20} {user['email']:<30} {user['age'] or 'N/A':<5}")
+        logger.info(f"Retrieved {len(users)} users.")
+        # get_all() logs errors and returns [], so check against the seed data.
+        assert {user['email'] for user in users} == SEED_USER_EMAILS, f"Unexpected users: {users}"
 
+def test_create_user():
+    """Test 2: Create User"""
+    print_separator("Test 2: Create User")
+    with DatabaseManager(DB_CONFIG).connect() as conn:
+        _delete_test_user(conn)
+        try:
+            new_id = UsersDAO(conn).create("Test User (Python)", TEST_EMAIL, 29)
+            assert new_id, "Create operation returned no ID"
+            logger.info("Create operation validated.")
+        finally:
+            logger.info(f"Cleaned up {_delete_test_user(conn)} test records.")
+
+def test_update_user():
+    """Test 3: Update User"""
+    print_separator("Test 3: Update User")
+    with DatabaseManager(DB_CONFIG).connect() as conn:
+        user_dao = UsersDAO(conn)
+        _delete_test_user(conn)
+        try:
+            user_dao.create("Test User (Python)", TEST_EMAIL, 29)
+            assert user_dao.increment_age(TEST_EMAIL), "Update operation affected 0 rows"
+            logger.info("Update operation validated.")
+        finally:
+            logger.info(f"Cleaned up {_delete_test_user(conn)} test records.")
+
+def test_columnar_read():
+    """Test 4: Columnar Read"""
+    print_separator("Test 4: Columnar Read")
+    with DatabaseManager(DB_CONFIG).connect() as conn:
+        orders = OrdersDAO(conn).get_all(columnar=True)
+        assert len(orders) == SEED_ORDER_COUNT, f"Expected {SEED_ORDER_COUNT} orders, got {len(orders)}"
+        delivered = orders.filter(orders.mask("status", "==", "delivered"))
+        print(f"Orders: {len(orders)} ({orders.nbytes} bytes columnar)")
+        print(f"Revenue (all): {orders.sum('total_price')}")
+        print(f"Revenue (delivered): {delivered.sum('total_price')}")
+        print(f"Average quantity: {orders.mean('quantity'):.2f}")
+        assert orders.sum('total_price') == SEED_ORDER_TOTAL, "Columnar revenue does not match the seed data"
+        assert delivered.sum('total_price') == SEED_DELIVERED_TOTAL, "Delivered revenue does not match the seed data"
+        logger.info(f"Retrieved {len(orders)} orders in columnar format.")
+
+def run_tests():
+    logger.info("Starting Enterprise MySQL Test Suite...")
+
+    try:
+        test_read_users()
+        test_create_user()
+        test_update_user()
+        test_columnar_read()
     except Exception as e:
         logger.critical(f"Test suite failed due to unexpected error: {e}")
         sys.exit(1)
@@ -0,0 +1,265 @@
+# Copyright (c) 2026 dmj.one
+#
+# This software is part of the dmj.one initiative.
+# Created by Nikhil Bhardwaj.
+#
+# Licensed under the MIT License.
+#!/usr/bin/env python3
+"""
+Columnar Result Set Checks
+Unit checks for samples/python/columnar.py: raw value decoders, NULL masks,
+filtering and aggregation. Every check runs twice, once with NumPy (if it is
+installed) and once on the plain-array fallback. No MySQL server is needed.
+
+Run: python samples/python/test_columnar.py
+     python scripts/run_sample_tests.py samples/python/test_columnar.py
+"""
+
+import datetime
+from contextlib import contextmanager
+from decimal import Decimal
+
+import columnar
+from columnar import (Column, ColumnarResult, DecimalColumn, StringColumn, TimestampColumn,
+                      _days_from_civil, parse_decimal, parse_timestamp)
+
+
+@contextmanager
+def numpy_disabled():
+    saved = columnar.np
+    columnar.np = None
+    try:
+        yield
+    finally:
+        columnar.np = saved
+
+
+def each_backend(check):
+    """Run check() on the NumPy path (when available) and on the fallback path."""
+    if columnar.np is not None:
+        check()
+    with numpy_disabled():
+        check()
+
+
+def orders_result() -> ColumnarResult:
+    columns = [Column("id"), DecimalColumn("total_price"), StringColumn("status"), TimestampColumn("order_date")]
+    rows = [
+        (b"1", b"999.99", b"delivered", b"2026-01-05 05:47:59"),
+        (b"2", b"39.98", b"shipped", b"2026-01-06 00:00:00"),
+        (b"3", b"-0.50", None, None),
+        (None, b"49.99", b"shipped", b"2026-01-07 12:30:00"),
+        (b"5", b"0.00", b"", b"2026-01-08 23:59:59"),
+    ]
+    return ColumnarResult.from_rows(columns, [rows])
+
+
+def test_parse_decimal():
+    assert parse_decimal(b"999.99", 2) == 99999
+    assert parse_decimal(b"-123.45", 2) == -12345
+    assert parse_decimal(b"-0.50", 2) == -50
+    assert parse_decimal(b"-0.05", 2) == -5
+    assert parse_decimal(b"7", 2) == 700
+    assert parse_decimal(b"1.5", 3) == 1500
+    assert parse_decimal(b"42", 0) == 42
+    assert parse_decimal(bytearray(b"10.10"), 2) == 1010
+    try:
+        parse_decimal(b"1.234", 2)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("parse_decimal accepted more digits than the scale")
+    print("[OK] parse_decimal signs and scales")
+
+
+def test_days_from_civil():
+    epoch = datetime.date(1970, 1, 1)
+    for day in (datetime.date(1970, 1, 1), datetime.date(1969, 12, 31), datetime.date(2000, 2, 29),
+                datetime.date(1900, 3, 1), datetime.date(2026, 10, 19), datetime.date(1, 1, 1),
+                datetime.date(9999, 12, 31)):
+        assert _days_from_civil(day.year, day.month, day.day) == (day - epoch).days, day
+    stamp = datetime.datetime(2026, 1, 5, 5, 47, 59, tzinfo=datetime.timezone.utc)
+    assert parse_timestamp(b"2026-01-05 05:47:59") == int(stamp.timestamp())
+    assert parse_timestamp(b"2026-01-05 05:47:59.123456") == int(stamp.timestamp())
+    assert parse_timestamp(b"1970-01-02") == 86400
+    assert parse_timestamp("2026-01-05T05:47:59") == int(stamp.timestamp())
+    for invalid in (b"0000-00-00 00:00:00", b"0000-00-00", b"2026-00-10", b"2026-02-29", b"0000-01-01"):
+        try:
+            parse_timestamp(invalid)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"parse_timestamp accepted {invalid!r}")
+    print("[OK] _days_from_civil and parse_timestamp")
+
+
+def test_null_masks():
+    def check():
+        result = orders_result()
+        assert result["id"][3] is None and result["id"][4] == 5
+        assert result["status"][2] is None and result["status"][4] == ""
+        assert result.count("id") == 4
+        assert result.count("status") == 4
+        assert result.count("order_date") == 4
+        assert result.count("total_price") == 5
+        assert list(result.mask("id", ">=", 0)) == [1, 1, 1, 0, 1]
+        assert list(result.mask("status", "!=", "shipped")) == [1, 0, 0, 0, 1]
+        assert list(result.mask("status", "==", "")) == [0, 0, 0, 0, 1]
+    each_backend(check)
+    print("[OK] NULL masks and counts")
+
+
+def test_string_count_with_nulls():
+    def check():
+        column = StringColumn("name")
+        for raw in (b"a", None, b"c"):
+            column.append_raw(raw)
+        assert len(column) == 3
+        assert column.count() == 2
+    each_backend(check)
+    print("[OK] string column count with NULLs")
+
+
+def test_filter_and_take():
+    def check():
+        result = orders_result()
+        shipped = result.filter(result.mask("status", "==", "shipped"))
+        assert len(shipped) == 2
+        assert list(shipped.rows()) == [
+            {"id": 2, "total_price": Decimal("39.98"), "status": "shipped",
+             "order_date": datetime.datetime(2026, 1, 6)},
+            {"id": None, "total_price": Decimal("49.99"), "status": "shipped",
+             "order_date": datetime.datetime(2026, 1, 7, 12, 30)},
+        ]
+        positive = result.filter(result.mask("total_price", ">", "0"))
+        assert [r["status"] for r in positive.rows()] == ["delivered", "shipped", "shipped"]
+        empty = result.filter(result.mask("status", "==", "cancelled"))
+        assert len(empty) == 0 and list(empty.rows()) == []
+        assert len(result.filter([True] * len(result))) == len(result)
+    each_backend(check)
+    print("[OK] filter/take")
+
+
+def test_batches_and_bytearray_values():
+    def check():
+        # The pure-Python connector returns bytearray; the C extension returns bytes.
+        columns = [Column("id"), DecimalColumn("price"), StringColumn("name"), TimestampColumn("ts")]
+        first = [(None, None, None, None), (bytearray(b"2"), bytearray(b"-12.30"), bytearray(b"x"),
+                                            bytearray(b"2026-01-05 05:47:59.250"))]
+        second = [(b"3", b"0.05", b"yz", b"1970-01-02")]
+        result = ColumnarResult.from_rows(columns, [first, [], second])
+        assert len(result) == 3
+        assert list(result.rows()) == [
+            {"id": None, "price": None, "name": None, "ts": None},
+            {"id": 2, "price": Decimal("-12.30"), "name": "x", "ts": datetime.datetime(2026, 1, 5, 5, 47, 59)},
+            {"id": 3, "price": Decimal("0.05"), "name": "yz", "ts": datetime.datetime(1970, 1, 2)},
+        ]
+        assert result.sum("price", where=result.mask("id", ">", 0)) == Decimal("-12.25")
+        assert result.count("name", where=[True, True, False]) == 1
+    each_backend(check)
+    print("[OK] batched, bytearray and NULL-first decoding")
+
+
+def test_aggregates():
+    def check():
+        result = orders_result()
+        assert result.sum("total_price") == Decimal("1089.46")
+        assert result.min("total_price") == Decimal("-0.50")
+        assert result.max("total_price") == Decimal("999.99")
+        assert result.sum("id") == 11
+        assert result.mean("id") == 11 / 4
+        assert result.min("status") == "" and result.max("status") == "shipped"
+        assert result.max("order_date") == datetime.datetime(2026, 1, 8, 23, 59, 59)
+    each_backend(check)
+    print("[OK] aggregates")
+
+
+def test_decimal_mask_bounds():
+    def check():
+        result = orders_result()
+        # Bounds with more digits than the scale (2) must not be truncated.
+        assert list(result.mask("total_price", "<", "0.005")) == [0, 0, 1, 0, 1]
+        assert list(result.mask("total_price", "<=", "0.005")) == [0, 0, 1, 0, 1]
+        assert list(result.mask("total_price", ">", "-0.505")) == [1, 1, 1, 1, 1]
+        assert list(result.mask("total_price", ">=", "-0.495")) == [1, 1, 0, 1, 1]
+        assert list(result.mask("total_price", "==", "0.004")) == [0, 0, 0, 0, 0]
+        assert list(result.mask("total_price", "!=", "0.004")) == [1, 1, 1, 1, 1]
+        assert list(result.mask("total_price", "==", Decimal("39.980"))) == [0, 1, 0, 0, 0]
+        assert list(result.mask("total_price", "<", 0)) == [0, 0, 1, 0, 0]
+    each_backend(check)
+    print("[OK] decimal mask bounds")
+
+
+def test_timestamp_values():
+    def check():
+        result = orders_result()
+        assert list(result.mask("order_date", ">=", "2026-01-07")) == [0, 0, 0, 1, 1]
+        assert list(result.mask("order_date", "<", b"2026-01-06 00:00:01")) == [1, 1, 0, 0, 0]
+        assert list(result.mask("order_date", "==", datetime.datetime(2026, 1, 6))) == [0, 1, 0, 0, 0]
+        assert list(result.mask("order_date", "<", datetime.date(2026, 1, 6))) == [1, 0, 0, 0, 0]
+
+        # MySQL zero dates and other invalid dates are NULL, as with cursor(dictionary=True).
+        column = TimestampColumn("d", date_only=True)
+        column.extend_raw([b"2026-01-05", b"0000-00-00", None, b"2026-02-30"])
+        column.extend_raw([b"0000-01-01 00:00:00"])
+        column.append_raw(b"0000-00-00 00:00:00")
+        column.append_raw(b"1999-12-31")
+        assert [column[i] for i in range(len(column))] == [
+            datetime.date(2026, 1, 5), None, None, None, None, None, datetime.date(1999, 12, 31)]
+        assert column.count() == 2
+        try:
+            column.sum()
+        except TypeError:
+            pass
+        else:
+            raise AssertionError("timestamp column summed")
+    each_backend(check)
+    print("[OK] timestamp masks, dates and zero dates")
+
+
+def test_values_wider_than_int64():
+    def check():
+        # BIGINT UNSIGNED max and DECIMAL(20,2) overflow int64; the column switches to Python ints.
+        ids = Column("id")
+        ids.extend_raw([b"1", None])
+        ids.extend_raw([b"18446744073709551615", b"2"])
+        ids.append_raw(b"18446744073709551614")
+        assert ids.wide and len(ids) == 5
+        assert [ids[i] for i in range(5)] == [1, None, 18446744073709551615, 2, 18446744073709551614]
+        assert ids.sum() == 36893488147419103232
+        assert list(ids.mask(">", 2 ** 63)) == [0, 0, 1, 0, 1]
+
+        result = ColumnarResult.from_rows([DecimalColumn("amount"), StringColumn("tag")], [
+            [(b"1.00", b"a"), (b"-2.50", b"b")],
+            [(b"123456789012345678.90", b"a"), (None, b"a")],
+        ])
+        amounts = result["amount"]
+        assert amounts.wide and amounts[2] == Decimal("123456789012345678.90")
+        assert result.sum("amount", where=result.mask("tag", "==", "a")) == Decimal("123456789012345679.90")
+        assert list(result.mask("amount", "<", "0.005")) == [0, 1, 0, 0]
+        assert result.max("amount") == Decimal("123456789012345678.90")
+        assert len(result.filter(result.mask("amount", ">", 0))) == 2
+
+        preset = DecimalColumn("big", scale=2, wide=True)
+        preset.append_raw(b"99999999999999999999.99")
+        assert preset[0] == Decimal("99999999999999999999.99")
+    each_backend(check)
+    print("[OK] values wider than int64")
+
+
+def main():
+    test_parse_decimal()
+    test_days_from_civil()
+    test_null_masks()
+    test_string_count_with_nulls()
+    test_filter_and_take()
+    test_batches_and_bytearray_values()
+    test_aggregates()
+    test_decimal_mask_bounds()
+    test_timestamp_values()
+    test_values_wider_than_int64()
+    print(f"\nAll columnar checks passed (NumPy {'enabled' if columnar.np is not None else 'not installed'}).")
+
+
+if __name__ == "__main__":
+    main()
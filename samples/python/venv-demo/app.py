@@ -4,9 +4,10 @@
 # 2. Install packages from requirements.txt
 # 3. Run this script using the virtual environment
 
-import requests
 from colorama import Fore, Style, init
 
+from http_client import HttpClient
+
 # Initialize colorama for colored output
 init()
 
@@ -17,9 +18,11 @@ def main():
     print()
     
     # Make a simple HTTP request to demonstrate 'requests' works
+    # (via http_client.HttpClient, the pooled/cached wrapper; see benchmark.py)
     print(f"{Fore.YELLOW}Making HTTP request to httpbin.org...{Style.RESET_ALL}")
     try:
-        response = requests.get("https://httpbin.org/json", timeout=5)
+        with HttpClient(timeout=5) as client:
+            response = client.get("https://httpbin.org/json")
         if response.status_code == 200:
             data = response.json()
             print(f"{Fore.GREEN}[OK] Request successful!{Style.RESET_ALL}")
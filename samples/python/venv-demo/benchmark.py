@@ -0,0 +1,163 @@
+# Benchmark: one-off requests.get per call vs the pooled HttpClient.
+#
+# Starts a local stub HTTP/1.1 server (keep-alive, ETag support, optional
+# artificial latency) and fetches the same set of URLs five ways:
+#   per_call      requests.get() for every URL (new connection each time)
+#   pooled        HttpClient.get() sequentially over one keep-alive session
+#   pooled_batch  HttpClient.get_many() on a bounded thread pool
+#   cold_cache    get_many() with an empty on-disk cache (every response stored)
+#   cached_batch  get_many() again with the now warm cache (304 revalidation)
+#
+# Run: python benchmark.py [--requests 200] [--latency-ms 5] [--workers 16]
+
+import argparse
+import hashlib
+import json
+import shutil
+import statistics
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List
+
+import requests
+from colorama import Fore, Style, init
+
+from http_client import HttpClient
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    disable_nagle_algorithm = True  # headers and body go out in separate writes
+    latency = 0.0
+    connections = 0
+    lock = threading.Lock()
+
+    def setup(self):
+        super().setup()
+        with StubHandler.lock:
+            StubHandler.connections += 1
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        body = json.dumps({"path": self.path, "items": list(range(50))}).encode()
+        etag = '"' + hashlib.md5(body).hexdigest() + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server(latency: float) -> ThreadingHTTPServer:
+    StubHandler.latency = latency
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def summarize(name: str, count: int, elapsed: float, latencies: List[float], connections: int) -> Dict:
+    ordered = sorted(latencies)
+
+    def pct(p: float) -> float:
+        return ordered[min(len(ordered) - 1, int(p * len(ordered)))] * 1000
+
+    return {
+        "mode": name,
+        "requests": count,
+        "seconds": elapsed,
+        "req_per_sec": count / elapsed,
+        "latency_ms": {"mean": statistics.mean(ordered) * 1000, "p50": pct(0.50), "p95": pct(0.95), "p99": pct(0.99)},
+        "connections_opened": connections,
+    }
+
+
+def run_mode(name: str, urls: List[str], run: Callable[[List[str]], List[float]]) -> Dict:
+    """Time one fetch strategy; run() returns the per-request latencies."""
+    before = StubHandler.connections
+    start = time.perf_counter()
+    latencies = run(urls)
+    elapsed = time.perf_counter() - start
+    return summarize(name, len(urls), elapsed, latencies, StubHandler.connections - before)
+
+
+def per_call(urls: List[str]) -> List[float]:
+    """The original app.py approach: a one-off requests.get per URL."""
+    latencies = []
+    for url in urls:
+        start = time.perf_counter()
+        requests.get(url, timeout=10).raise_for_status()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def sequential(client: HttpClient) -> Callable[[List[str]], List[float]]:
+    return lambda urls: [client.get(url).elapsed for url in urls]
+
+
+def batch(client: HttpClient) -> Callable[[List[str]], List[float]]:
+    def run(urls: List[str]) -> List[float]:
+        results = client.get_many(urls)
+        failed = [r for r in results if r.error is not None]
+        if failed:
+            raise RuntimeError(f"{len(failed)} requests failed, e.g. {failed[0].error}")
+        return [r.response.elapsed for r in results]
+    return run
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark per-call requests.get vs the pooled HttpClient.")
+    parser.add_argument("--requests", type=int, default=200, help="requests per mode")
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="artificial server latency per request")
+    parser.add_argument("--workers", type=int, default=16, help="batch fetch thread pool size")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    init()
+    server = start_server(args.latency_ms / 1000)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    urls = [f"{base}/item/{i}" for i in range(args.requests)]
+    cache_dir = tempfile.mkdtemp(prefix="http-cache-")
+    results = []
+
+    try:
+        results.append(run_mode("per_call", urls, per_call))
+
+        with HttpClient(max_workers=args.workers, per_host_limit=args.workers) as client:
+            results.append(run_mode("pooled", urls, sequential(client)))
+            results.append(run_mode("pooled_batch", urls, batch(client)))
+
+        with HttpClient(max_workers=args.workers, per_host_limit=args.workers, cache_dir=cache_dir) as client:
+            results.append(run_mode("cold_cache", urls, batch(client)))
+            results.append(run_mode("cached_batch", urls, batch(client)))
+    finally:
+        server.shutdown()
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    baseline = results[0]["req_per_sec"]
+    print(f"{Fore.CYAN}{'Mode':<14} {'req/s':>9} {'speedup':>8} "
+          f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'conns':>6}{Style.RESET_ALL}")
+    for r in results:
+        lat = r["latency_ms"]
+        print(f"{r['mode']:<14} {r['req_per_sec']:>9.1f} {r['req_per_sec'] / baseline:>7.1f}x "
+              f"{lat['p50']:>8.2f} {lat['p95']:>8.2f} {lat['p99']:>8.2f} {r['connections_opened']:>6}")
+
+
+if __name__ == "__main__":
+    main()
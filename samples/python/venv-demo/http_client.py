@@ -0,0 +1,300 @@
+# Pooled, concurrent, cache-aware HTTP client for apps built from this template.
+#
+# - One shared requests.Session with a keep-alive connection pool, so repeated
+#   calls reuse TCP/TLS connections instead of opening a new one every time.
+# - get_many() fetches a batch of URLs on a bounded thread pool. URLs are
+#   queued per host and only dispatched while their host is under its
+#   concurrency limit, so one slow host cannot take every worker.
+# - An optional on-disk cache stores responses that carry an ETag or
+#   Last-Modified header, revalidates them with If-None-Match /
+#   If-Modified-Since, and evicts least-recently-used entries past a size cap.
+#
+# Usage:
+#   client = HttpClient(cache_dir=".http-cache")
+#   data = client.get("https://httpbin.org/json").json()
+#   results = client.get_many(["https://a.example/x", "https://b.example/y"])
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+
+@dataclass
+class HttpResponse:
+    url: str
+    status_code: int
+    headers: CaseInsensitiveDict
+    content: bytes
+    from_cache: bool = False
+    elapsed: float = 0.0  # seconds, including any revalidation round trip
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        return json.loads(self.content)
+
+
+@dataclass
+class FetchResult:
+    url: str
+    response: Optional[HttpResponse] = None
+    error: Optional[Exception] = field(default=None, repr=False)
+
+
+class DiskCache:
+    """ETag/Last-Modified response cache on disk with LRU eviction by total size.
+
+    Bodies are written to a temp file and renamed into place, so a reader never
+    sees a partial body. The index is kept in memory and written at most every
+    `save_interval` seconds and on close(); a crash loses only the recent
+    index updates, and those entries are refetched later.
+    """
+
+    INDEX_FILE = "index.json"
+
+    def __init__(self, directory: str, max_bytes: int = 64 * 1024 * 1024, save_interval: float = 5.0):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.save_interval = save_interval
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        # key -> {"url", "etag", "last_modified", "status", "headers", "size"}; order = LRU -> MRU
+        self._index: "OrderedDict[str, dict]" = OrderedDict(self._load_index())
+        self.total_bytes = sum(meta["size"] for meta in self._index.values())
+        self._dirty = False
+        self._last_save = time.monotonic()
+
+    @staticmethod
+    def key(url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _body_path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ".body")
+
+    def _load_index(self) -> List:
+        try:
+            with open(os.path.join(self.directory, self.INDEX_FILE)) as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return []
+        return [(k, v) for k, v in entries if os.path.exists(self._body_path(k))]
+
+    def _write_atomic(self, path: str, data: bytes):
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            raise
+
+    def flush(self):
+        """Write the index to disk if it changed since the last save."""
+        with self._lock:
+            if not self._dirty:
+                return
+            snapshot = list(self._index.items())
+            self._dirty = False
+            self._last_save = time.monotonic()
+        with self._save_lock:
+            self._write_atomic(os.path.join(self.directory, self.INDEX_FILE), json.dumps(snapshot).encode("utf-8"))
+
+    def close(self):
+        self.flush()
+
+    def lookup(self, url: str) -> Optional[dict]:
+        """Validator metadata for url, or None. Marks the entry as recently used."""
+        with self._lock:
+            meta = self._index.get(self.key(url))
+            if meta is not None:
+                self._index.move_to_end(self.key(url))
+            return meta
+
+    def load(self, url: str) -> Optional[HttpResponse]:
+        meta = self.lookup(url)
+        if meta is None:
+            return None
+        try:
+            with open(self._body_path(self.key(url)), "rb") as f:
+                content = f.read()
+        except OSError:
+            return None
+        return HttpResponse(url, meta["status"], CaseInsensitiveDict(meta["headers"]), content, from_cache=True)
+
+    def store(self, response: HttpResponse):
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if response.status_code != 200 or not (etag or last_modified):
+            return
+        if "no-store" in response.headers.get("Cache-Control", ""):
+            return
+        if len(response.content) > self.max_bytes:
+            return
+        key = self.key(response.url)
+        self._write_atomic(self._body_path(key), response.content)
+        with self._lock:
+            previous = self._index.pop(key, None)
+            if previous is not None:
+                self.total_bytes -= previous["size"]
+            self._index[key] = {
+                "url": response.url,
+                "etag": etag,
+                "last_modified": last_modified,
+                "status": response.status_code,
+                "headers": dict(response.headers),
+                "size": len(response.content),
+            }
+            self.total_bytes += len(response.content)
+            evicted = self._evict()
+            self._dirty = True
+            save_due = time.monotonic() - self._last_save >= self.save_interval
+        for old_key in evicted:
+            try:
+                os.remove(self._body_path(old_key))
+            except OSError:
+                pass
+        if save_due:
+            self.flush()
+
+    def _evict(self) -> List[str]:
+        """Drop LRU entries until under max_bytes; returns keys whose bodies to delete."""
+        evicted = []
+        while self.total_bytes > self.max_bytes and self._index:
+            key, meta = self._index.popitem(last=False)
+            self.total_bytes -= meta["size"]
+            evicted.append(key)
+        return evicted
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+class HttpClient:
+    """Shared keep-alive session with batch fetching, per-host limits and caching."""
+
+    def __init__(self, max_workers: int = 16, per_host_limit: int = 6, pool_size: int = 32,
+                 timeout: float = 10.0, cache_dir: Optional[str] = None,
+                 cache_max_bytes: int = 64 * 1024 * 1024):
+        self.max_workers = max_workers
+        self.per_host_limit = per_host_limit
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.cache = DiskCache(cache_dir, cache_max_bytes) if cache_dir else None
+        self._host_limits: Dict[str, threading.BoundedSemaphore] = {}
+        self._host_lock = threading.Lock()
+
+    def _host_limit(self, url: str) -> threading.BoundedSemaphore:
+        host = urlsplit(url).netloc
+        with self._host_lock:
+            if host not in self._host_limits:
+                self._host_limits[host] = threading.BoundedSemaphore(self.per_host_limit)
+            return self._host_limits[host]
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> HttpResponse:
+        start = time.perf_counter()
+        request_headers = dict(headers or {})
+        meta = self.cache.lookup(url) if self.cache is not None else None
+        if meta:
+            if meta.get("etag"):
+                request_headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                request_headers["If-Modified-Since"] = meta["last_modified"]
+
+        with self._host_limit(url):
+            raw = self.session.get(url, headers=request_headers, timeout=self.timeout)
+
+        if raw.status_code == 304 and meta:
+            cached = self.cache.load(url)
+            if cached is not None:
+                cached.elapsed = time.perf_counter() - start
+                return cached
+            # Body vanished from disk; fetch again without validators.
+            with self._host_limit(url):
+                raw = self.session.get(url, headers=headers, timeout=self.timeout)
+
+        response = HttpResponse(url, raw.status_code, CaseInsensitiveDict(raw.headers), raw.content,
+                                elapsed=time.perf_counter() - start)
+        if self.cache is not None:
+            self.cache.store(response)
+        return response
+
+    def _fetch(self, url: str, headers: Optional[Dict[str, str]]) -> FetchResult:
+        try:
+            return FetchResult(url, response=self.get(url, headers))
+        except requests.RequestException as e:
+            return FetchResult(url, error=e)
+
+    def get_many(self, urls: List[str], headers: Optional[Dict[str, str]] = None) -> List[FetchResult]:
+        """Fetch urls concurrently; results are returned in input order.
+
+        URLs are queued per host and handed to the pool only while their host
+        has a free slot (per_host_limit), taking one URL per host in turn, so
+        workers are never parked waiting on a busy host.
+        """
+        results: List[Optional[FetchResult]] = [None] * len(urls)
+        queues: "OrderedDict[str, deque]" = OrderedDict()
+        for i, url in enumerate(urls):
+            queues.setdefault(urlsplit(url).netloc, deque()).append(i)
+        workers = min(self.max_workers, max(1, len(urls)))
+        in_flight: Dict[str, int] = {host: 0 for host in queues}
+        futures: Dict[Future, tuple] = {}
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            while queues or futures:
+                submitted = True
+                while submitted and len(futures) < workers:
+                    submitted = False
+                    for host in list(queues):
+                        if len(futures) >= workers:
+                            break
+                        if in_flight[host] >= self.per_host_limit:
+                            continue
+                        i = queues[host].popleft()
+                        if not queues[host]:
+                            del queues[host]
+                        futures[pool.submit(self._fetch, urls[i], headers)] = (i, host)
+                        in_flight[host] += 1
+                        submitted = True
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    i, host = futures.pop(future)
+                    in_flight[host] -= 1
+                    results[i] = future.result()
+        return results
+
+    def close(self):
+        self.session.close()
+        if self.cache is not None:
+            self.cache.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,186 @@
+# Behavior checks for http_client.py against a local stub HTTP/1.1 server.
+#
+# Covers the parts benchmark.py does not exercise:
+#   - LRU eviction once the disk cache passes max_bytes
+#   - Last-Modified / If-Modified-Since revalidation
+#   - the cache index being reloaded after close()
+#   - per-host fairness in get_many() (a slow host cannot hold every worker)
+#
+# Run: python test_http_client.py
+#      python ../../../scripts/run_sample_tests.py test_http_client.py
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, List
+
+from http_client import DiskCache, HttpClient
+
+LAST_MODIFIED = "Mon, 05 Jan 2026 05:47:59 GMT"
+
+
+class CheckHandler(BaseHTTPRequestHandler):
+    """Routes:
+    /etag/<name>/<size>   body of <size> bytes with an ETag
+    /lm/<name>            Last-Modified only; 304 when If-Modified-Since matches
+    /slow/<name>          sleeps `latency` seconds before answering
+    """
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append((time.perf_counter(), self.path, dict(self.headers)))
+            server.active += 1
+            server.peak = max(server.peak, server.active)
+        try:
+            parts = self.path.strip("/").split("/")
+            if parts[0] == "slow":
+                time.sleep(server.latency)
+            if parts[0] == "lm":
+                if self.headers.get("If-Modified-Since") == LAST_MODIFIED:
+                    self._send(304, b"", {"Last-Modified": LAST_MODIFIED})
+                else:
+                    self._send(200, self.path.encode(), {"Last-Modified": LAST_MODIFIED})
+            elif parts[0] == "etag":
+                etag = f'"{parts[1]}"'
+                if self.headers.get("If-None-Match") == etag:
+                    self._send(304, b"", {"ETag": etag})
+                else:
+                    self._send(200, b"x" * int(parts[2]), {"ETag": etag})
+            else:
+                self._send(200, self.path.encode(), {})
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def _send(self, status: int, body: bytes, headers: Dict[str, str]):
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@contextmanager
+def stub_server(latency: float = 0.0) -> Iterator[ThreadingHTTPServer]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), CheckHandler)
+    server.daemon_threads = True
+    server.latency = latency
+    server.lock = threading.Lock()
+    server.requests: List[tuple] = []
+    server.active = server.peak = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def base_url(server: ThreadingHTTPServer) -> str:
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+
+@contextmanager
+def cache_dir() -> Iterator[str]:
+    path = tempfile.mkdtemp(prefix="http-cache-check-")
+    try:
+        yield path
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def test_lru_eviction():
+    with stub_server() as server, cache_dir() as directory:
+        base = base_url(server)
+        with HttpClient(cache_dir=directory, cache_max_bytes=1000) as client:
+            for name in ("a", "b", "c"):
+                client.get(f"{base}/etag/{name}/400")
+            cache = client.cache
+            # 1200 bytes > 1000: "a" (least recently used) is gone, body file included.
+            assert cache.lookup(f"{base}/etag/a/400") is None
+            assert not os.path.exists(cache._body_path(cache.key(f"{base}/etag/a/400")))
+            assert len(cache) == 2 and cache.total_bytes == 800
+
+            # Touching "b" makes "c" the eviction candidate.
+            assert client.get(f"{base}/etag/b/400").from_cache
+            client.get(f"{base}/etag/d/400")
+            assert cache.lookup(f"{base}/etag/c/400") is None
+            assert cache.lookup(f"{base}/etag/b/400") is not None
+            assert cache.total_bytes == 800
+
+            # A body larger than the whole cache is not stored and evicts nothing.
+            client.get(f"{base}/etag/huge/2000")
+            assert cache.lookup(f"{base}/etag/huge/2000") is None and len(cache) == 2
+    print("[OK] LRU eviction at max_bytes")
+
+
+def test_last_modified_revalidation():
+    with stub_server() as server, cache_dir() as directory:
+        url = f"{base_url(server)}/lm/report"
+        with HttpClient(cache_dir=directory) as client:
+            first = client.get(url)
+            second = client.get(url)
+        assert first.status_code == 200 and not first.from_cache
+        assert second.from_cache and second.status_code == 200 and second.content == b"/lm/report"
+        assert "If-Modified-Since" not in server.requests[0][2]
+        assert server.requests[1][2].get("If-Modified-Since") == LAST_MODIFIED
+        assert "If-None-Match" not in server.requests[1][2]
+    print("[OK] Last-Modified revalidation")
+
+
+def test_index_reload_after_close():
+    with stub_server() as server, cache_dir() as directory:
+        base = base_url(server)
+        urls = [f"{base}/etag/item{i}/100" for i in range(5)]
+        with HttpClient(cache_dir=directory) as client:
+            client.get_many(urls)
+        # save_interval (5 s) has not passed, so only close() can have written the index.
+        reloaded = DiskCache(directory)
+        assert len(reloaded) == 5 and reloaded.total_bytes == 500
+        assert reloaded.load(urls[0]).content == b"x" * 100
+
+        with HttpClient(cache_dir=directory) as client:
+            results = client.get_many(urls)
+        assert all(r.error is None and r.response.from_cache for r in results)
+        assert all(h.get("If-None-Match") for _, _, h in server.requests[5:])
+    print("[OK] cache index reloaded after close()")
+
+
+def test_get_many_per_host_fairness():
+    with stub_server(latency=0.3) as slow, stub_server() as fast:
+        slow_urls = [f"{base_url(slow)}/slow/{i}" for i in range(8)]
+        fast_url = f"{base_url(fast)}/fast"
+        with HttpClient(max_workers=8, per_host_limit=2) as client:
+            start = time.perf_counter()
+            results = client.get_many(slow_urls + [fast_url])
+        assert [r.url for r in results] == slow_urls + [fast_url]
+        assert all(r.error is None and r.response.ok for r in results)
+        # The fast host is served right away, not after the slow host's queue drains.
+        fast_at = fast.requests[0][0] - start
+        assert fast_at < 0.2, f"fast host waited {fast_at:.2f}s"
+        assert slow.peak <= 2, f"slow host saw {slow.peak} concurrent requests (limit 2)"
+    print("[OK] get_many per-host fairness")
+
+
+def main():
+    test_lru_eviction()
+    test_last_modified_revalidation()
+    test_index_reload_after_close()
+    test_get_many_per_host_fairness()
+    print("\nAll HTTP client checks passed.")
+
+
+if __name__ == "__main__":
+    main()
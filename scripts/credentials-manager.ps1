@@ -209,6 +209,7 @@ function Update-MySQLUser {
 DROP USER IF EXISTS '$Username'@'localhost';
 CREATE USER '$Username'@'localhost' IDENTIFIED BY '$NewPassword';
 GRANT ALL PRIVILEGES ON $Database.* TO '$Username'@'localhost';
+GRANT ALL ON ``$Database\_w%``.* TO '$Username'@'localhost';
 FLUSH PRIVILEGES;
 SELECT 'User $Username updated successfully!' AS status;
 "@
@@ -812,6 +812,7 @@ INSERT INTO orders (user_id, product_id, quantity, total_price, status) VALUES
 DROP USER IF EXISTS '$dbUser'@'localhost';
 CREATE USER '$dbUser'@'localhost' IDENTIFIED BY '$dbPass';
 GRANT ALL PRIVILEGES ON $dbName.* TO '$dbUser'@'localhost';
+GRANT ALL ON ``$dbName\_w%``.* TO '$dbUser'@'localhost';
 FLUSH PRIVILEGES;
 
 SELECT 'Database setup completed successfully!' AS status;
@@ -0,0 +1,346 @@
+# Copyright (c) 2026 dmj.one
+#
+# This software is part of the dmj.one initiative.
+# Created by Nikhil Bhardwaj.
+#
+# Licensed under the MIT License.
+#!/usr/bin/env python3
+"""
+Parallel Sample Test Runner
+Discovers the top-level test_* functions in the Python sample programs and runs
+each one in its own interpreter process, several at a time.
+
+- Isolation: every test runs in a fresh process. If the sample module defines
+  setup_isolation(worker_id) it is called first (mysql_test.py uses this to give
+  each worker slot its own schema). teardown_isolation(worker_id), if defined,
+  runs once per worker slot after all tests, in its own process.
+- Skips: a sample is skipped only when an optional third-party package
+  (OPTIONAL_DEPENDENCIES) is missing; any other import failure is an error.
+- Timeouts: a test that exceeds --timeout is killed and reported as an error.
+- Scheduling: tests are started slowest-first using durations recorded by
+  previous runs (unknown tests are treated as slowest).
+- Reporting: optional JUnit XML with per-test timings.
+
+Run: python scripts/run_sample_tests.py [-j 8] [--timeout 60] [--junit-xml report.xml]
+"""
+
+import argparse
+import ast
+import importlib.util
+import json
+import os
+import queue
+import subprocess
+import sys
+import time
+import traceback
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+# Configuration
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_SAMPLES = [
+    os.path.join(project_root, "samples", "python", "basic_test.py"),
+    os.path.join(project_root, "samples", "python", "mysql_test.py"),
+    os.path.join(project_root, "samples", "python", "test_columnar.py"),
+    os.path.join(project_root, "samples", "python", "venv-demo", "test_http_client.py"),
+]
+DEFAULT_DURATIONS_FILE = os.path.join(project_root, ".test-durations.json")
+
+# Third-party packages a sample may need that CI does not install
+OPTIONAL_DEPENDENCIES = frozenset({"mysql", "pymysql", "requests"})
+
+# Child exit codes
+EXIT_PASSED = 0
+EXIT_FAILED = 1
+EXIT_ERROR = 2
+EXIT_SKIPPED = 3
+
+
+@dataclass
+class TestCase:
+    path: str
+    name: str
+
+    @property
+    def module(self) -> str:
+        return os.path.splitext(os.path.basename(self.path))[0]
+
+    @property
+    def test_id(self) -> str:
+        return f"{self.module}::{self.name}"
+
+
+@dataclass
+class TestResult:
+    case: TestCase
+    status: str  # passed | failed | error | skipped
+    duration: float
+    worker: int
+    stdout: str = ""
+    stderr: str = ""
+    message: str = ""
+    error_type: str = ""
+
+
+# ==============================================================================
+# DISCOVERY
+# ==============================================================================
+
+def discover(paths: List[str], keyword: Optional[str] = None) -> List[TestCase]:
+    """Find top-level test_* functions without importing the sample modules."""
+    cases = []
+    for path in paths:
+        with open(path, encoding="utf-8-sig") as f:
+            tree = ast.parse(f.read(), filename=path)
+        for node in tree.body:
+            if not isinstance(node, ast.FunctionDef) or not node.name.startswith("test_"):
+                continue
+            if len(node.args.args) > len(node.args.defaults):
+                continue  # requires arguments; not a standalone test
+            case = TestCase(os.path.abspath(path), node.name)
+            if keyword is None or keyword in case.test_id:
+                cases.append(case)
+    return cases
+
+
+def find_teardowns(paths: List[str]) -> List[str]:
+    """Sample files that define a top-level teardown_isolation function."""
+    found = []
+    for path in paths:
+        with open(path, encoding="utf-8-sig") as f:
+            tree = ast.parse(f.read(), filename=path)
+        if any(isinstance(node, ast.FunctionDef) and node.name == "teardown_isolation" for node in tree.body):
+            found.append(os.path.abspath(path))
+    return found
+
+
+# ==============================================================================
+# SCHEDULING
+# ==============================================================================
+
+def load_durations(path: str) -> Dict[str, float]:
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path) as f:
+            return {k: float(v) for k, v in json.load(f).items()}
+    except (OSError, ValueError):
+        return {}
+
+
+def save_durations(path: str, durations: Dict[str, float], results: List[TestResult]):
+    for result in results:
+        if result.status in ("passed", "failed"):
+            durations[result.case.test_id] = round(result.duration, 4)
+    with open(path, "w") as f:
+        json.dump(durations, f, indent=2, sort_keys=True)
+
+
+def schedule(cases: List[TestCase], durations: Dict[str, float]) -> List[TestCase]:
+    """Longest-processing-time-first order; tests with no history go first."""
+    return sorted(cases, key=lambda c: durations.get(c.test_id, float("inf")), reverse=True)
+
+
+# ==============================================================================
+# EXECUTION
+# ==============================================================================
+
+def load_sample(path: str):
+    """Import a sample file as a module; its directory goes on sys.path for local imports."""
+    sys.path.insert(0, os.path.dirname(path))
+    module_name = os.path.splitext(os.path.basename(path))[0]
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_child(path: str, name: str, worker_id: int) -> int:
+    """Entry point inside the test subprocess."""
+    try:
+        module = load_sample(path)
+    except ModuleNotFoundError as e:
+        if (e.name or "").split(".")[0] in OPTIONAL_DEPENDENCIES:
+            print(f"Skipped: missing dependency '{e.name}'", file=sys.stderr)
+            return EXIT_SKIPPED
+        traceback.print_exc()
+        return EXIT_ERROR
+    except Exception:
+        traceback.print_exc()
+        return EXIT_ERROR
+    try:
+        setup = getattr(module, "setup_isolation", None)
+        if setup is not None:
+            setup(worker_id)
+        getattr(module, name)()
+    except Exception:
+        traceback.print_exc()
+        return EXIT_FAILED
+    return EXIT_PASSED
+
+
+def run_teardown_child(path: str, worker_id: int) -> int:
+    """Entry point inside the teardown subprocess for one worker slot."""
+    try:
+        load_sample(path).teardown_isolation(worker_id)
+    except Exception:
+        traceback.print_exc()
+        return EXIT_FAILED
+    return EXIT_PASSED
+
+
+def run_case(case: TestCase, slots: "queue.Queue[int]", timeout: float) -> TestResult:
+    worker = slots.get()
+    cmd = [sys.executable, os.path.abspath(__file__), "--child", case.path, case.name, str(worker)]
+    env = dict(os.environ, SAMPLE_TEST_WORKER=str(worker), PYTHONIOENCODING="utf-8")
+    start = time.perf_counter()
+    try:
+        proc = subprocess.run(cmd, capture_output=True, text=True, encoding="utf-8",
+                              errors="replace", timeout=timeout, env=env)
+    except subprocess.TimeoutExpired as e:
+        return TestResult(case, "error", time.perf_counter() - start, worker,
+                          stdout=_text(e.stdout), stderr=_text(e.stderr),
+                          message=f"Timed out after {timeout:g}s", error_type="Timeout")
+    finally:
+        slots.put(worker)
+    duration = time.perf_counter() - start
+    if proc.returncode == EXIT_PASSED:
+        status, message = "passed", ""
+    elif proc.returncode == EXIT_SKIPPED:
+        status, message = "skipped", proc.stderr.strip()
+    else:
+        lines = proc.stderr.strip().splitlines()
+        status = "error" if proc.returncode == EXIT_ERROR else "failed"
+        message = lines[-1] if lines else f"Exit code {proc.returncode}"
+    error_type = "ImportError" if status == "error" else ""
+    return TestResult(case, status, duration, worker, proc.stdout, proc.stderr, message, error_type)
+
+
+def _text(output) -> str:
+    if output is None:
+        return ""
+    return output.decode("utf-8", "replace") if isinstance(output, bytes) else output
+
+
+def run_all(cases: List[TestCase], jobs: int, timeout: float) -> List[TestResult]:
+    slots: "queue.Queue[int]" = queue.Queue()
+    for worker in range(jobs):
+        slots.put(worker)
+    results = []
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(run_case, case, slots, timeout) for case in cases]
+        for future in as_completed(futures):
+            result = future.result()
+            tag = {"passed": "OK", "failed": "FAIL", "error": "ERROR", "skipped": "SKIP"}[result.status]
+            print(f"[{tag}] {result.case.test_id} ({result.duration:.2f}s, worker {result.worker})"
+                  + (f" - {result.message}" if result.message and result.status != "passed" else ""))
+            results.append(result)
+    return results
+
+
+def run_teardowns(paths: List[str], results: List[TestResult], timeout: float):
+    """Call teardown_isolation once per worker slot that ran tests from each sample.
+
+    Failures are printed as warnings; they leave state behind but do not
+    change any test result.
+    """
+    for path in paths:
+        # Slots whose tests got as far as setup_isolation (not skipped or failed to import).
+        workers = sorted({r.worker for r in results if r.case.path == path
+                          and (r.status in ("passed", "failed") or r.error_type == "Timeout")})
+        for worker in workers:
+            cmd = [sys.executable, os.path.abspath(__file__), "--teardown", path, str(worker)]
+            label = f"{os.path.basename(path)} teardown_isolation({worker})"
+            try:
+                proc = subprocess.run(cmd, capture_output=True, text=True, encoding="utf-8",
+                                      errors="replace", timeout=timeout,
+                                      env=dict(os.environ, PYTHONIOENCODING="utf-8"))
+            except subprocess.TimeoutExpired:
+                print(f"[WARN] {label} timed out after {timeout:g}s")
+                continue
+            if proc.returncode != EXIT_PASSED:
+                lines = proc.stderr.strip().splitlines()
+                print(f"[WARN] {label} failed - {lines[-1] if lines else f'exit code {proc.returncode}'}")
+
+
+# ==============================================================================
+# REPORTING
+# ==============================================================================
+
+def write_junit(path: str, results: List[TestResult], wall_time: float):
+    root = ET.Element("testsuites", name="samples", tests=str(len(results)), time=f"{wall_time:.3f}")
+    by_module: Dict[str, List[TestResult]] = {}
+    for result in results:
+        by_module.setdefault(result.case.module, []).append(result)
+    for module, module_results in sorted(by_module.items()):
+        counts = {s: sum(1 for r in module_results if r.status == s) for s in ("failed", "error", "skipped")}
+        suite = ET.SubElement(root, "testsuite", name=module, tests=str(len(module_results)),
+                              failures=str(counts["failed"]), errors=str(counts["error"]),
+                              skipped=str(counts["skipped"]),
+                              time=f"{sum(r.duration for r in module_results):.3f}")
+        for result in sorted(module_results, key=lambda r: r.case.name):
+            case = ET.SubElement(suite, "testcase", classname=module, name=result.case.name,
+                                 time=f"{result.duration:.3f}", file=os.path.relpath(result.case.path, project_root))
+            if result.status == "failed":
+                ET.SubElement(case, "failure", message=result.message).text = result.stderr
+            elif result.status == "error":
+                ET.SubElement(case, "error", type=result.error_type, message=result.message).text = result.stderr
+            elif result.status == "skipped":
+                ET.SubElement(case, "skipped", message=result.message)
+            if result.stdout:
+                ET.SubElement(case, "system-out").text = result.stdout
+            if result.stderr:
+                ET.SubElement(case, "system-err").text = result.stderr
+    ET.ElementTree(root).write(path, encoding="utf-8", xml_declaration=True)
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run the Python sample test_* functions in parallel.")
+    parser.add_argument("paths", nargs="*", default=DEFAULT_SAMPLES, help="sample files to collect tests from")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="parallel test processes")
+    parser.add_argument("-k", dest="keyword", help="only run tests whose id contains this substring")
+    parser.add_argument("--timeout", type=float, default=60.0, help="per-test timeout in seconds")
+    parser.add_argument("--junit-xml", help="write a JUnit XML report to this path")
+    parser.add_argument("--durations-file", default=DEFAULT_DURATIONS_FILE,
+                        help="historical durations used for slowest-first scheduling")
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str]) -> int:
+    if argv[:1] == ["--child"]:
+        return run_child(argv[1], argv[2], int(argv[3]))
+    if argv[:1] == ["--teardown"]:
+        return run_teardown_child(argv[1], int(argv[2]))
+
+    args = parse_args(argv)
+    cases = discover(args.paths, args.keyword)
+    if not cases:
+        print("No tests found.")
+        return EXIT_FAILED
+    durations = load_durations(args.durations_file)
+    jobs = max(1, min(args.jobs, len(cases)))
+    print(f"Running {len(cases)} tests with {jobs} workers...")
+
+    start = time.perf_counter()
+    results = run_all(schedule(cases, durations), jobs, args.timeout)
+    wall_time = time.perf_counter() - start
+    run_teardowns(find_teardowns(args.paths), results, args.timeout)
+
+    save_durations(args.durations_file, durations, results)
+    if args.junit_xml:
+        write_junit(args.junit_xml, results, wall_time)
+        print(f"JUnit report written to {args.junit_xml}")
+
+    counts = {s: sum(1 for r in results if r.status == s) for s in ("passed", "failed", "error", "skipped")}
+    serial_time = sum(r.duration for r in results)
+    print(f"\n{counts['passed']} passed, {counts['failed']} failed, {counts['error']} errors, "
+          f"{counts['skipped']} skipped in {wall_time:.2f}s (serial {serial_time:.2f}s)")
+    return EXIT_PASSED if counts["failed"] == 0 and counts["error"] == 0 else EXIT_FAILED
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
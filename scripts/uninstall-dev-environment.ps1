@@ -22,7 +22,7 @@
     - Visual Studio Code
     - Python packages (mysql-connector-python, pymysql)
     - Environment variables (JAVA_HOME, M2_HOME, MYSQL_INCLUDE, MYSQL_LIB)
-    - Test database (testdb)
+    - Test database (testdb) and the per-worker test schemas (testdb_w<N>)
     - Downloaded connectors in lib folder
 
 .PARAMETER All
@@ -271,9 +271,12 @@ if ($uninstallMySQL) {
         $mysql = Get-Command mysql -ErrorAction SilentlyContinue
         if ($mysql) {
             # Try without password first
-            & mysql -u root -e "DROP DATABASE IF EXISTS testdb; DROP USER IF EXISTS 'testuser'@'localhost';" 2>$null
+            # Per-worker schemas left by scripts/run_sample_tests.py (testdb_w0, testdb_w1, ...)
+            $workerSchemas = & mysql -u root -N -e "SHOW DATABASES LIKE 'testdb\_w%'" 2>$null
+            $dropWorkers = ($workerSchemas | ForEach-Object { "DROP DATABASE IF EXISTS $_;" }) -join " "
+            & mysql -u root -e "$dropWorkers DROP DATABASE IF EXISTS testdb; DROP USER IF EXISTS 'testuser'@'localhost';" 2>$null
             if ($LASTEXITCODE -eq 0) {
-                Write-Success "Test database 'testdb' and user 'testuser' removed"
+                Write-Success "Test database 'testdb', its worker schemas and user 'testuser' removed"
             }
             else {
                 Write-Warn "Could not connect to MySQL to drop database. You may need to do this manually."